@@ -10,23 +10,239 @@ Features:
 - make_email(...) factory to build EmailMessage safely (preferred to monkeypatching).
 """
 
-import importlib
+import functools
 import json
 import logging
+import smtplib
+import threading
+import time
+import traceback
+from contextlib import contextmanager
 from typing import Optional, Iterable
 
-from django.core.cache import cache
+from django.apps import apps
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.mail import EmailMessage
 from django.core.mail.backends.smtp import EmailBackend
-from django.template.loader import render_to_string
+from django.core.signals import request_finished, request_started
+from django.db import DatabaseError, close_old_connections, transaction
+from django.template.loader import get_template
 from django.utils.module_loading import import_string
 
-from base.models import DynamicEmailConfiguration, EmailLog
+from base.models import Company, DynamicEmailConfiguration, EmailLog
 from horilla import settings
 from horilla.horilla_middlewares import _thread_locals
 
 logger = logging.getLogger(__name__)
 
+# A cached connection idle for longer than this is checked with NOOP before reuse,
+# since NAT or the server may have silently dropped it.
+SMTP_IDLE_CHECK_SECONDS = 30
+
+# Open SMTP connections, kept per thread and keyed by (host, port, username) so that
+# consecutive send_messages calls reuse one session instead of repeating the
+# TCP/TLS/AUTH handshake for every email.
+_smtp_connections = threading.local()
+
+
+def _get_connection_pool() -> dict:
+    pool = getattr(_smtp_connections, "pool", None)
+    if pool is None:
+        pool = _smtp_connections.pool = {}
+    return pool
+
+
+def _get_connection_last_used() -> dict:
+    last_used = getattr(_smtp_connections, "last_used", None)
+    if last_used is None:
+        last_used = _smtp_connections.last_used = {}
+    return last_used
+
+
+def _quit_connection(connection) -> None:
+    try:
+        connection.quit()
+    except (smtplib.SMTPServerDisconnected, OSError):
+        # Server already hung up; just release the socket.
+        connection.close()
+    except smtplib.SMTPException:
+        logger.debug("Error while closing SMTP connection.", exc_info=True)
+
+
+def close_cached_connections(**kwargs) -> None:
+    """
+    Quit every SMTP connection cached for the current thread.
+    Connected to request_finished so connections live for one request at most.
+    Outside a request, connections are pooled only inside reuse_smtp_connections();
+    otherwise ConfiguredEmailBackend.close() quits them directly.
+    """
+    pool = getattr(_smtp_connections, "pool", None)
+    if not pool:
+        return
+    for connection in pool.values():
+        _quit_connection(connection)
+    pool.clear()
+    _get_connection_last_used().clear()
+
+
+request_finished.connect(
+    close_cached_connections, dispatch_uid="horilla_close_cached_smtp_connections"
+)
+
+
+@contextmanager
+def reuse_smtp_connections():
+    """
+    Pool SMTP connections for the duration of a job in a thread without a request
+    (mail threads, schedulers) and quit them on exit. Also usable as a decorator,
+    e.g. on Thread.run.
+    """
+    depth = getattr(_smtp_connections, "scope_depth", 0)
+    _smtp_connections.scope_depth = depth + 1
+    try:
+        yield
+    finally:
+        _smtp_connections.scope_depth = depth
+        if not depth:
+            close_cached_connections()
+
+EMAIL_LOG_BATCH_SIZE = 500
+# Shared compact encoder for EmailLog.to recipient lists.
+_encode_recipients = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# EmailLog rows collected during a request when HORILLA_EMAIL_LOG_ASYNC is enabled.
+# They are written in one bulk insert once the response has been sent.
+_pending_email_logs = threading.local()
+
+
+def write_email_logs(logs) -> None:
+    """Insert EmailLog instances in bulk, falling back to row-by-row on database errors."""
+    try:
+        with transaction.atomic():
+            EmailLog.objects.bulk_create(logs, batch_size=EMAIL_LOG_BATCH_SIZE)
+    except DatabaseError:
+        # one bad row (e.g. an over-long recipient list) should not drop the whole batch
+        for log in logs:
+            try:
+                # own savepoint so a failure cannot break the caller's transaction
+                with transaction.atomic():
+                    log.save()
+            except Exception:
+                logger.exception("Failed to write EmailLog entry.")
+    except Exception:
+        # ensure logging failures don't break email sending flow
+        logger.exception("Failed to write EmailLog entries.")
+
+
+def _start_email_log_buffer(**kwargs) -> None:
+    _pending_email_logs.logs = []
+
+
+def flush_email_logs(**kwargs) -> None:
+    """Write the EmailLog rows buffered during the current request."""
+    logs = getattr(_pending_email_logs, "logs", None)
+    _pending_email_logs.logs = None
+    if logs:
+        write_email_logs(logs)
+        # Django's close_old_connections already ran on request_finished; the
+        # insert reopened the connection, so apply CONN_MAX_AGE again.
+        close_old_connections()
+
+
+request_started.connect(_start_email_log_buffer, dispatch_uid="horilla_start_email_log_buffer")
+request_finished.connect(flush_email_logs, dispatch_uid="horilla_flush_email_logs")
+
+
+# make_email memoizes display names per request in _thread_locals.dyn_display_cache.
+# Outside a request it stays None, so long-lived workers always read the shared cache.
+def _start_display_name_memo(**kwargs) -> None:
+    _thread_locals.dyn_display_cache = {}
+
+
+def _clear_display_name_memo(**kwargs) -> None:
+    _thread_locals.dyn_display_cache = None
+
+
+request_started.connect(_start_display_name_memo, dispatch_uid="horilla_start_display_name_memo")
+request_finished.connect(_clear_display_name_memo, dispatch_uid="horilla_clear_display_name_memo")
+
+# DynamicEmailConfiguration values cached per company (or "primary") so that
+# instantiating a backend does not hit the database on every send.
+# The post_save/post_delete invalidation only reaches other workers through a
+# shared cache (Redis, memcached). With the default per-process LocMem cache,
+# other workers only pick up edits when the entry expires, so the
+# short LOCMEM timeout bounds how long they keep a stale host or password.
+DYNAMIC_EMAIL_CONFIG_TIMEOUT = 600
+DYNAMIC_EMAIL_CONFIG_LOCMEM_TIMEOUT = 30
+DYNAMIC_EMAIL_CONFIG_FIELDS = (
+    "host",
+    "port",
+    "username",
+    "password",
+    "use_tls",
+    "use_ssl",
+    "fail_silently",
+    "timeout",
+    "from_email",
+    "display_name",
+    "use_dynamic_display_name",
+)
+
+
+# reply_to / display name entries cached per user for make_email
+SENDER_CACHE_TIMEOUT = 300
+
+# (backend attribute, configuration key, settings fallback, default). A value the
+# configuration leaves unset (None) falls back to Django settings, except for the
+# server and credentials: those resolve to "" so EmailBackend's own settings
+# fallback cannot send the settings credentials to a company's server.
+DYNAMIC_EMAIL_ATTRIBUTES = (
+    ("dynamic_host", "host", "EMAIL_HOST", None),
+    ("dynamic_port", "port", "EMAIL_PORT", None),
+    ("dynamic_username", "username", "EMAIL_HOST_USER", None),
+    ("dynamic_mail_sent_from", "from_email", "DEFAULT_FROM_EMAIL", None),
+    ("dynamic_display_name", "display_name", None, None),
+    ("dynamic_password", "password", "EMAIL_HOST_PASSWORD", None),
+    ("dynamic_use_tls", "use_tls", "EMAIL_USE_TLS", None),
+    ("dynamic_fail_silently", "fail_silently", "EMAIL_FAIL_SILENTLY", True),
+    ("dynamic_use_ssl", "use_ssl", "EMAIL_USE_SSL", None),
+    ("dynamic_timeout", "timeout", "EMAIL_TIMEOUT", None),
+)
+DYNAMIC_EMAIL_SERVER_KEYS = frozenset({"host", "username", "password"})
+
+
+def dynamic_email_config_to_dict(configuration) -> Optional[dict]:
+    """Reduce a DynamicEmailConfiguration row to the cacheable dict used by the backend."""
+    if configuration is None:
+        return None
+    return {field: getattr(configuration, field, None) for field in DYNAMIC_EMAIL_CONFIG_FIELDS}
+
+
+def dynamic_email_config_timeout() -> int:
+    if isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache):
+        return DYNAMIC_EMAIL_CONFIG_LOCMEM_TIMEOUT
+    return DYNAMIC_EMAIL_CONFIG_TIMEOUT
+
+
+def dynamic_email_config_cache_key(company_id=None) -> str:
+    return f"dyn_email_cfg:{company_id or 'primary'}"
+
+
+def invalidate_dynamic_email_config_cache() -> None:
+    """
+    Drop every cached DynamicEmailConfiguration. A company without its own
+    configuration caches the primary one, so all company keys are cleared.
+    """
+    if hasattr(cache, "delete_pattern"):
+        cache.delete_pattern("dyn_email_cfg:*")
+        return
+    company_ids = Company.objects.values_list("pk", flat=True)
+    cache.delete_many(
+        [dynamic_email_config_cache_key()]
+        + [dynamic_email_config_cache_key(pk) for pk in company_ids]
+    )
+
 
 class DefaultHorillaMailBackend(EmailBackend):
     """
@@ -51,72 +267,81 @@ class DefaultHorillaMailBackend(EmailBackend):
         # Resolve configuration from DB if possible. This function is safe if called
         # with no request (management commands, Celery workers).
         try:
-            self.configuration = self.get_dynamic_email_config()
+            configuration = self.get_dynamic_email_config()
         except Exception:
             # Any exception when resolving DB config should not break init.
             logger.exception("Failed to load dynamic email configuration; falling back to settings.")
-            self.configuration = None
-
-        ssl_keyfile = (
-            getattr(self.configuration, "ssl_keyfile", None)
-            if self.configuration
-            else ssl_keyfile or getattr(settings, "ssl_keyfile", None)
-        )
-        ssl_certfile = (
-            getattr(self.configuration, "ssl_certfile", None)
-            if self.configuration
-            else ssl_certfile or getattr(settings, "ssl_certfile", None)
-        )
-
-        # Prepare values resolved from configuration or settings
-        resolved_host = self.dynamic_host
-        resolved_port = self.dynamic_port
-        resolved_username = self.dynamic_username
-        resolved_password = self.dynamic_password
-        resolved_use_tls = self.dynamic_use_tls
-        resolved_fail_silently = self.dynamic_fail_silently
-        resolved_use_ssl = self.dynamic_use_ssl
-        resolved_timeout = self.dynamic_timeout
+            configuration = None
+        self.apply_configuration(configuration)
 
         # Call parent init with resolved values.
         # EmailBackend signature accepts these keyword args in Django stable releases.
         super().__init__(
-            host=resolved_host,
-            port=resolved_port,
-            username=resolved_username,
-            password=resolved_password,
-            use_tls=resolved_use_tls,
-            fail_silently=resolved_fail_silently,
-            use_ssl=resolved_use_ssl,
-            timeout=resolved_timeout,
+            host=self.dynamic_host,
+            port=self.dynamic_port,
+            username=self.dynamic_username,
+            password=self.dynamic_password,
+            use_tls=self.dynamic_use_tls,
+            fail_silently=self.dynamic_fail_silently,
+            use_ssl=self.dynamic_use_ssl,
+            timeout=self.dynamic_timeout,
             ssl_keyfile=ssl_keyfile,
             ssl_certfile=ssl_certfile,
             **kwargs,
         )
+        if self.configuration:
+            # EmailBackend falls back to settings.EMAIL_HOST for any falsy host; keep
+            # the configuration's (possibly empty) host instead of mixing sources.
+            self.host = self.dynamic_host
 
     @staticmethod
-    def get_dynamic_email_config() -> Optional[DynamicEmailConfiguration]:
+    def get_dynamic_email_config() -> Optional[dict]:
         """
         Try to load DynamicEmailConfiguration for the current request/company.
-        Return None if not available.
+        The resolved configuration is cached as a plain dict (see
+        DYNAMIC_EMAIL_CONFIG_FIELDS). Return None if not available.
         """
+        if not apps.ready:
+            # avoid DB hits while Django is still starting up (e.g. migrations)
+            return None
         request = getattr(_thread_locals, "request", None)
+        employee = None
         company = None
         try:
             if request and getattr(request, "user", None) and not request.user.is_anonymous:
-                # adjust to your actual method to fetch company from user
-                company = request.user.employee_get.get_company()
+                # resolved once and reused below for the display name / reply_to
+                employee = request.user.employee_get
+                company = employee.get_company()
         except Exception:
             # don't fail the whole lookup if user object shape is unexpected
             logger.debug("Could not determine company from request user.", exc_info=True)
             company = None
 
-        try:
-            configuration = (
-                DynamicEmailConfiguration.objects.filter(company_id=company).first()
+        def load_primary_configuration():
+            return dynamic_email_config_to_dict(
+                DynamicEmailConfiguration.objects.filter(is_primary=True).first()
             )
+
+        def load_company_configuration():
+            configuration = DynamicEmailConfiguration.objects.filter(company_id=company).first()
             if configuration is None:
-                configuration = DynamicEmailConfiguration.objects.filter(is_primary=True).first()
+                return load_primary_configuration()
+            return dynamic_email_config_to_dict(configuration)
+
+        try:
+            if company is None:
+                # no company to match, only the primary mail server can apply
+                configuration = cache.get_or_set(
+                    dynamic_email_config_cache_key(),
+                    load_primary_configuration,
+                    dynamic_email_config_timeout(),
+                )
+            else:
+                configuration = cache.get_or_set(
+                    dynamic_email_config_cache_key(company.pk),
+                    load_company_configuration,
+                    dynamic_email_config_timeout(),
+                )
         except Exception:
             # DB not available or model error
             logger.exception("Error querying DynamicEmailConfiguration.")
@@ -125,69 +350,48 @@ class DefaultHorillaMailBackend(EmailBackend):
         # If configuration found, prepare caching of display name/reply_to for request user
         if configuration:
             try:
-                display_email_name = f"{configuration.display_name} <{configuration.from_email}>"
+                display_email_name = f"{configuration['display_name']} <{configuration['from_email']}>"
                 user_id = ""
-                if request and getattr(request, "user", None) and request.user.is_authenticated:
-                    if getattr(configuration, "use_dynamic_display_name", False):
+                sender_values = {}
+                if employee is not None and request.user.is_authenticated:
+                    employee_address = f"{employee.get_full_name()} <{employee.get_email()}>"
+                    if configuration.get("use_dynamic_display_name"):
                         # if enabled, display from user's full name + email
-                        display_email_name = f"{request.user.employee_get.get_full_name()} <{request.user.employee_get.get_email()}>"
+                        display_email_name = employee_address
                     user_id = request.user.pk
-                    reply_to = [
-                        f"{request.user.employee_get.get_full_name()} <{request.user.employee_get.get_email()}>"
-                    ]
-                    cache.set(f"reply_to{request.user.pk}", reply_to)
-                cache.set(f"dynamic_display_name{user_id}", display_email_name)
+                    sender_values[f"reply_to{user_id}"] = [employee_address]
+                sender_values[f"dynamic_display_name{user_id}"] = display_email_name
+                cache.set_many(sender_values, timeout=SENDER_CACHE_TIMEOUT)
+                display_names = getattr(_thread_locals, "dyn_display_cache", None)
+                if display_names is not None:
+                    display_names[user_id] = display_email_name
             except Exception:
                 logger.exception("Failed to cache dynamic display name/reply_to.")
 
         return configuration
 
-    # dynamic property accessors with safe fallbacks to settings
-    @property
-    def dynamic_host(self):
-        return getattr(self.configuration, "host", None) if self.configuration else getattr(settings, "EMAIL_HOST", None)
-
-    @property
-    def dynamic_port(self):
-        return getattr(self.configuration, "port", None) if self.configuration else getattr(settings, "EMAIL_PORT", None)
-
-    @property
-    def dynamic_username(self):
-        return getattr(self.configuration, "username", None) if self.configuration else getattr(settings, "EMAIL_HOST_USER", None)
-
-    @property
-    def dynamic_mail_sent_from(self):
-        return getattr(self.configuration, "from_email", None) if self.configuration else getattr(settings, "DEFAULT_FROM_EMAIL", None)
-
-    @property
-    def dynamic_display_name(self):
-        return getattr(self.configuration, "display_name", None) if self.configuration else None
+    def apply_configuration(self, configuration: Optional[dict]) -> None:
+        """
+        Resolve the dynamic_* SMTP values once from the given configuration dict,
+        with safe fallbacks to settings when there is none.
+        """
+        self.configuration = configuration
+        values = configuration or {}
+        for attribute, key, setting_name, default in DYNAMIC_EMAIL_ATTRIBUTES:
+            value = values.get(key)
+            if value is None:
+                if configuration and key in DYNAMIC_EMAIL_SERVER_KEYS:
+                    value = ""
+                else:
+                    value = getattr(settings, setting_name, default) if setting_name else default
+            setattr(self, attribute, value)
 
-    @property
-    def dynamic_from_email_with_display_name(self):
         if self.dynamic_display_name:
-            return f"{self.dynamic_display_name} <{self.dynamic_mail_sent_from}>"
-        return self.dynamic_mail_sent_from
-
-    @property
-    def dynamic_password(self):
-        return getattr(self.configuration, "password", None) if self.configuration else getattr(settings, "EMAIL_HOST_PASSWORD", None)
-
-    @property
-    def dynamic_use_tls(self):
-        return getattr(self.configuration, "use_tls", None) if self.configuration else getattr(settings, "EMAIL_USE_TLS", None)
-
-    @property
-    def dynamic_fail_silently(self):
-        return getattr(self.configuration, "fail_silently", None) if self.configuration else getattr(settings, "EMAIL_FAIL_SILENTLY", True)
-
-    @property
-    def dynamic_use_ssl(self):
-        return getattr(self.configuration, "use_ssl", None) if self.configuration else getattr(settings, "EMAIL_USE_SSL", None)
-
-    @property
-    def dynamic_timeout(self):
-        return getattr(self.configuration, "timeout", None) if self.configuration else getattr(settings, "EMAIL_TIMEOUT", None)
+            self.dynamic_from_email_with_display_name = (
+                f"{self.dynamic_display_name} <{self.dynamic_mail_sent_from}>"
+            )
+        else:
+            self.dynamic_from_email_with_display_name = self.dynamic_mail_sent_from
 
 
 # Resolve configured backend class (respect settings EMAIL_BACKEND if it points elsewhere)
@@ -195,12 +399,10 @@ EMAIL_BACKEND_PATH = getattr(settings, "EMAIL_BACKEND", "")
 BACKEND_CLASS = DefaultHorillaMailBackend
 DEFAULT_BACKEND_PATH = "base.backends.ConfiguredEmailBackend"
 
-if EMAIL_BACKEND_PATH and EMAIL_BACKEND_PATH != DEFAULT_BACKEND_PATH:
+if EMAIL_BACKEND_PATH and EMAIL_BACKEND_PATH.lower() != DEFAULT_BACKEND_PATH.lower():
     try:
-        module_path, class_name = EMAIL_BACKEND_PATH.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        BACKEND_CLASS = getattr(module, class_name)
-    except Exception:
+        BACKEND_CLASS = import_string(EMAIL_BACKEND_PATH)
+    except ImportError:
         logger.exception("Failed to import EMAIL_BACKEND from settings; falling back to DefaultHorillaMailBackend.")
         BACKEND_CLASS = DefaultHorillaMailBackend
 
@@ -209,23 +411,91 @@ class ConfiguredEmailBackend(BACKEND_CLASS):
     """
     Concrete backend used by Django when EMAIL_BACKEND references this module.
     It delegates sending to the parent backend and logs attempts to EmailLog.
+    SMTP connections are reused across send_messages calls (see close_cached_connections).
     """
 
+    def open(self):
+        """Reuse this thread's cached SMTP connection for the same server when it is
+        still healthy, otherwise open a new one and cache it."""
+        if not isinstance(self, EmailBackend) or self.connection:
+            return super().open()
+
+        pool = _get_connection_pool()
+        key = self._connection_key()
+        connection = pool.pop(key, None)
+        if connection is not None:
+            idle = time.monotonic() - _get_connection_last_used().get(key, 0)
+            if idle <= SMTP_IDLE_CHECK_SECONDS or self._is_alive(connection):
+                pool[key] = self.connection = connection
+                return False
+            # stale socket: drop it and reconnect once below
+            _quit_connection(connection)
+
+        opened = super().open()
+        if self.connection:
+            pool[key] = self.connection
+            _get_connection_last_used()[key] = time.monotonic()
+        return opened
+
+    def close(self):
+        """Detach from the shared connection instead of quitting it; cached
+        connections are closed by close_cached_connections when the request ends.
+        Threads without a request (mail threads, schedulers) never get that signal,
+        so there the connection is quit right away unless the job runs inside
+        reuse_smtp_connections()."""
+        if not isinstance(self, EmailBackend) or self.connection is None:
+            return super().close()
+        pool = _get_connection_pool()
+        key = self._connection_key()
+        if pool.get(key) is not self.connection:
+            return super().close()
+        if getattr(_thread_locals, "request", None) is None and not getattr(
+            _smtp_connections, "scope_depth", 0
+        ):
+            del pool[key]
+            _get_connection_last_used().pop(key, None)
+            return super().close()
+        self.connection = None
+
+    def _connection_key(self) -> tuple:
+        return (self.host, self.port, self.username)
+
+    def _evict_connection(self) -> None:
+        """Drop this server's cached connection so the next open() reconnects."""
+        key = self._connection_key()
+        connection = _get_connection_pool().pop(key, None) or self.connection
+        _get_connection_last_used().pop(key, None)
+        if connection is not None:
+            _quit_connection(connection)
+        self.connection = None
+
+    @staticmethod
+    def _is_alive(connection) -> bool:
+        try:
+            return connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
     def send_messages(self, email_messages: Optional[Iterable[EmailMessage]]):
         """Call parent send_messages and create EmailLog entries for each message.
         On exception capture the traceback and save it into EmailLog.error_message.
         Returns the same numeric response the parent backend returns (count of sent messages)."""
-        import traceback
-        import json
-        from base.models import EmailLog
-        from django.conf import settings
-
+        # materialize once: the parent consumes the iterable and the log loop reuses it
+        messages = list(email_messages or [])
         try:
             # call parent backend (this may raise)
-            response = super(ConfiguredEmailBackend, self).send_messages(email_messages)
+            response = super(ConfiguredEmailBackend, self).send_messages(messages)
+            if isinstance(self, EmailBackend):
+                if (response or 0) < sum(1 for message in messages if message.recipients()):
+                    # a failed send may have left a dead socket; don't hand it out again
+                    self._evict_connection()
+                elif response:
+                    _get_connection_last_used()[self._connection_key()] = time.monotonic()
             sent_flag = bool(response)
             exception_text = None
         except Exception:
+            if isinstance(self, EmailBackend):
+                self._evict_connection()
             # capture full traceback for logging and saving to EmailLog
             logger.exception("Error while sending messages in backend.")
             exception_text = traceback.format_exc()
@@ -233,22 +503,27 @@ class ConfiguredEmailBackend(BACKEND_CLASS):
             sent_flag = False
 
         # Create an EmailLog entry for each message (include traceback if failed)
-        for message in email_messages or []:
-            try:
-                EmailLog.objects.create(
-                    subject=message.subject or "",
-                    body=(message.body or "")[:4000],
-                    from_email=(
-                        getattr(self, "dynamic_from_email_with_display_name", None)
-                        or getattr(settings, "DEFAULT_FROM_EMAIL", "")
-                    ),
-                    to=json.dumps(message.to) if isinstance(message.to, (list, tuple)) else (message.to or ""),
-                    status="sent" if sent_flag else "failed",
-                    error_message=exception_text,
-                )
-            except Exception:
-                # ensure logging failures don't break email sending flow
-                logger.exception("Failed to write EmailLog entry.")
+        from_email = (
+            getattr(self, "dynamic_from_email_with_display_name", None)
+            or getattr(settings, "DEFAULT_FROM_EMAIL", "")
+        )
+        status = "sent" if sent_flag else "failed"
+        logs = [
+            EmailLog(
+                subject=message.subject or "",
+                body=(message.body or "")[:4000],
+                from_email=from_email,
+                to=_encode_recipients(message.to) if isinstance(message.to, (list, tuple)) else (message.to or ""),
+                status=status,
+                error_message=exception_text,
+            )
+            for message in messages
+        ]
+        buffered_logs = getattr(_pending_email_logs, "logs", None)
+        if getattr(settings, "HORILLA_EMAIL_LOG_ASYNC", False) and buffered_logs is not None:
+            buffered_logs.extend(logs)
+        else:
+            write_email_logs(logs)
 
         return response
 
@@ -257,6 +532,21 @@ class ConfiguredEmailBackend(BACKEND_CLASS):
 __all__ = ["ConfiguredEmailBackend", "DefaultHorillaMailBackend", "make_email"]
 
 
+@functools.lru_cache(maxsize=128)
+def _get_cached_template(template_name: str):
+    return get_template(template_name)
+
+
+def get_email_template(template_name: str):
+    """
+    Return the compiled email template, parsed once per process.
+    With DEBUG on the cache is skipped so template edits are picked up.
+    """
+    if settings.DEBUG:
+        return get_template(template_name)
+    return _get_cached_template(template_name)
+
+
 # -------------------------
 # Helper: safe factory
 # -------------------------
@@ -288,7 +578,14 @@ def make_email(
         logger.debug("Could not obtain request/user for dynamic reply_to.", exc_info=True)
 
     if not from_email:
-        from_email = cache.get(f"dynamic_display_name{user_id}") or getattr(settings, "DEFAULT_FROM_EMAIL", None)
+        # memoized per request so a view sending many emails hits the cache once
+        display_names = getattr(_thread_locals, "dyn_display_cache", None)
+        if display_names is not None and user_id in display_names:
+            from_email = display_names[user_id]
+        else:
+            from_email = cache.get(f"dynamic_display_name{user_id}") or getattr(settings, "DEFAULT_FROM_EMAIL", None)
+            if display_names is not None:
+                display_names[user_id] = from_email
 
     body = plain_message or ""
     msg = EmailMessage(
@@ -305,7 +602,7 @@ def make_email(
     # Render template if requested
     if template_name and context is not None:
         try:
-            html = render_to_string(template_name, context)
+            html = get_email_template(template_name).render(context)
             msg.body = html
             msg.content_subtype = "html"
         except Exception:
@@ -8,12 +8,13 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.signals import user_login_failed
 from django.db.models import Max, Q
-from django.db.models.signals import m2m_changed, post_migrate, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.dispatch import receiver
 from django.http import Http404
 from django.shortcuts import redirect, render
 
-from base.models import Announcement, PenaltyAccounts
+from base.backends import invalidate_dynamic_email_config_cache
+from base.models import Announcement, DynamicEmailConfiguration, PenaltyAccounts
 from horilla.methods import get_horilla_model_class
 
 
@@ -67,6 +68,15 @@ def create_deduction_cutleave_from_penalty(sender, instance, created, **kwargs):
             available.save()
 
 
+@receiver(post_save, sender=DynamicEmailConfiguration)
+@receiver(post_delete, sender=DynamicEmailConfiguration)
+def clear_dynamic_email_config_cache(sender, instance, **kwargs):
+    """
+    Drop the cached mail server configuration whenever one is changed or removed
+    """
+    invalidate_dynamic_email_config_cache()
+
+
 # @receiver(post_migrate)
 def clean_work_records(sender, **kwargs):
     if sender.label not in ["attendance"]:
@@ -46,7 +46,7 @@ from django.views.decorators.http import require_http_methods
 
 from accessibility.accessibility import ACCESSBILITY_FEATURE
 from accessibility.models import DefaultAccessibility
-from base.backends import ConfiguredEmailBackend
+from base.backends import ConfiguredEmailBackend, dynamic_email_config_to_dict
 from base.decorators import (
     shift_request_change_permission,
     work_type_request_change_permission,
@@ -1565,7 +1565,7 @@ def mail_server_test_email(request):
             emailconfig = DynamicEmailConfiguration.objects.filter(
                 id=instance_id
             ).first()
-            email_backend.configuration = emailconfig
+            email_backend.apply_configuration(dynamic_email_config_to_dict(emailconfig))
 
             try:
                 msg = EmailMultiAlternatives(
@@ -1,35 +1,90 @@
+import logging
+import threading
 from datetime import date
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.mail import send_mail
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
-from django.template.loader import render_to_string
+
+from base.backends import get_email_template
 
 from .models import Employee
 
+logger = logging.getLogger(__name__)
+
+ADMIN_EMAILS_CACHE_KEY = "visa_admin_emails"
+ADMIN_EMAILS_CACHE_TIMEOUT = 3600
+
+
+# (employee_id, days) pairs queued by employee_post_save and sent once the
+# surrounding transaction commits, so bulk creates share one SMTP session.
+_pending_visa_notifications = threading.local()
 
-@receiver(post_save, sender=Employee)
-def employee_post_save(sender, instance: Employee, created, **kwargs):
-    """When a new Employee is created, if their visa expires within 31 days
-    send notification emails to admins and the employee.
-    """
-    if not created:
-        return
 
-    if not instance.visa_expire_date:
+def get_admin_emails() -> list:
+    """Return the emails of all superusers (HR admins), cached for an hour."""
+    return cache.get_or_set(
+        ADMIN_EMAILS_CACHE_KEY,
+        lambda: list(
+            User.objects.filter(is_superuser=True, email__gt="").values_list(
+                "email", flat=True
+            )
+        ),
+        ADMIN_EMAILS_CACHE_TIMEOUT,
+    )
+
+
+def _get_pending_visa_notifications() -> list:
+    pending = getattr(_pending_visa_notifications, "items", None)
+    if pending is None:
+        pending = _pending_visa_notifications.items = []
+    return pending
+
+
+def _get_employee_email(employee):
+    try:
+        return employee.get_email() if hasattr(employee, "get_email") else employee.email
+    except Exception:
+        return getattr(employee, "email", None)
+
+
+def _build_message(subject, template_name, context, fallback_body, from_email, to):
+    """Build an HTML email from template_name, falling back to a plain text body."""
+    try:
+        html = get_email_template(template_name).render(context)
+    except Exception:
+        logger.exception("Failed to render %s; sending plain text.", template_name)
+        return EmailMultiAlternatives(subject, fallback_body, from_email, to)
+    message = EmailMultiAlternatives(subject, html, from_email, to)
+    message.attach_alternative(html, "text/html")
+    return message
+
+
+def flush_visa_notifications():
+    """Send every queued visa notification: one digest to the admins and one
+    email per employee, all over a single connection.
+    """
+    pending = _get_pending_visa_notifications()
+    if not pending:
         return
+    days_by_id = dict(pending)
+    pending.clear()
 
-    days = (instance.visa_expire_date - date.today()).days
-    # only notify for upcoming expiries within 31 days (including today)
-    if days < 0 or days > 30:
+    # Re-fetch so employees from rolled back transactions are skipped. entire()
+    # bypasses the company filter, which would hide employees whose work info
+    # has not been written yet.
+    employees = list(Employee.objects.entire().filter(pk__in=days_by_id))
+    if not employees:
         return
+    for employee in employees:
+        employee.days_until_visa_expiry = days_by_id[employee.pk]
+    employees.sort(key=lambda employee: employee.days_until_visa_expiry)
 
-    # Prepare admin recipients (superusers)
-    admin_emails = list(
-        User.objects.filter(is_superuser=True).values_list("email", flat=True)
-    )
+    admin_emails = get_admin_emails()
 
     from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None) or getattr(
         settings, "EMAIL_HOST_USER", None
@@ -37,56 +92,102 @@ def employee_post_save(sender, instance: Employee, created, **kwargs):
     if not from_email:
         from_email = "no-reply@localhost"
 
-    # Send admin summary (reuse template if present)
+    messages = []
     if admin_emails:
-        subject_admin = f"Employee visa expiring: {instance.get_full_name()}"
-        try:
-            body_admin = render_to_string(
-                "emails/visa_expiry_admin_notification.html",
-                {"employees": [instance], "days": days},
-            )
-            send_mail(
+        if len(employees) == 1:
+            subject_admin = f"Employee visa expiring: {employees[0].get_full_name()}"
+        else:
+            subject_admin = f"{len(employees)} employee visas expiring"
+        body = "\n".join(
+            f"Employee {employee.get_full_name()} has visa expiring on "
+            f"{employee.visa_expire_date} ({employee.days_until_visa_expiry} days remaining)."
+            for employee in employees
+        )
+        messages.append(
+            _build_message(
                 subject_admin,
-                body_admin,
+                "emails/visa_expiry_admin_notification.html",
+                {"employees": employees},
+                body,
                 from_email,
                 admin_emails,
-                html_message=body_admin,
-                fail_silently=True,
-            )
-        except Exception:
-            # Fallback plain text
-            body = (
-                f"Employee {instance.get_full_name()} has visa expiring on "
-                f"{instance.visa_expire_date} ({days} days remaining)."
             )
-            send_mail(subject_admin, body, from_email, admin_emails, fail_silently=True)
+        )
 
-    # Send notification to employee
-    try:
-        emp_email = instance.get_email() if hasattr(instance, "get_email") else instance.email
-    except Exception:
-        emp_email = getattr(instance, "email", None)
-
-    if emp_email:
-        subject_emp = "Your visa will expire soon"
-        try:
-            body_emp = render_to_string(
+    for employee in employees:
+        emp_email = _get_employee_email(employee)
+        if not emp_email:
+            continue
+        days = employee.days_until_visa_expiry
+        messages.append(
+            _build_message(
+                "Your visa will expire soon",
                 "emails/visa_expiry_notification.html",
-                {"employee": instance, "days": days},
-            )
-            send_mail(
-                subject_emp,
-                body_emp,
+                {"employee": employee, "days": days},
+                f"Your visa expires on {employee.visa_expire_date} ({days} days).",
                 from_email,
                 [emp_email],
-                html_message=body_emp,
-                fail_silently=True,
-            )
-        except Exception:
-            send_mail(
-                subject_emp,
-                f"Your visa expires on {instance.visa_expire_date} ({days} days).",
-                from_email,
-                [emp_email],
-                fail_silently=True,
             )
+        )
+
+    try:
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages(messages)
+    except Exception:
+        logger.exception("Failed to send visa expiry notifications.")
+
+
+@receiver(post_save, sender=Employee, dispatch_uid="visa_expiry")
+def employee_post_save(sender, instance: Employee, created, **kwargs):
+    """When a new Employee is created, if their visa expires within 31 days
+    queue notification emails to admins and the employee.
+    """
+    # fixtures (loaddata) and employees without a visa date never notify
+    if not created or kwargs.get("raw") or not instance.visa_expire_date:
+        return
+
+    days = (instance.visa_expire_date - date.today()).days
+    # only notify for upcoming expiries within 31 days (including today)
+    if days < 0 or days > 30:
+        return
+
+    _get_pending_visa_notifications().append((instance.pk, days))
+    # Runs immediately outside of a transaction; inside one, the first callback
+    # to run drains the queue and the rest are no-ops.
+    transaction.on_commit(flush_visa_notifications)
+
+
+def _admin_email_fields(user: User) -> tuple:
+    # read from __dict__ so deferred fields are not fetched just for the snapshot
+    return (user.__dict__.get("is_superuser"), user.__dict__.get("email"))
+
+
+@receiver(post_init, sender=User)
+def snapshot_admin_email_fields(sender, instance: User, **kwargs):
+    """Remember is_superuser/email as loaded, to detect changes on save."""
+    instance._admin_email_fields = _admin_email_fields(instance)
+
+
+@receiver(post_save, sender=User)
+def clear_admin_emails_cache(sender, instance: User, created, **kwargs):
+    """Invalidate the cached admin emails only when the superuser roster or a
+    superuser's email actually changed (e.g. not for employee login users)."""
+    current = _admin_email_fields(instance)
+    if created:
+        changed = bool(instance.is_superuser)
+    else:
+        update_fields = kwargs.get("update_fields")
+        if update_fields and not {"is_superuser", "email"} & set(update_fields):
+            return
+        previous = getattr(instance, "_admin_email_fields", None)
+        # only a superuser (now or before) can affect the list
+        changed = previous != current and (instance.is_superuser or (previous and previous[0]))
+    instance._admin_email_fields = current
+    if changed:
+        cache.delete(ADMIN_EMAILS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=User)
+def clear_admin_emails_cache_on_delete(sender, instance: User, **kwargs):
+    if instance.is_superuser:
+        cache.delete(ADMIN_EMAILS_CACHE_KEY)
@@ -11,7 +11,7 @@ from django.contrib import messages
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 
-from base.backends import ConfiguredEmailBackend
+from base.backends import ConfiguredEmailBackend, reuse_smtp_connections
 from base.models import Department
 from employee.models import EmployeeWorkInformation
 from helpdesk.models import Ticket
@@ -83,6 +83,7 @@ class TicketSendThread(Thread):
                     self.request, f"Mail not sent to {recipient.get_full_name()}"
                 )
 
+    @reuse_smtp_connections()
     def run(self) -> None:
         super().run()
 
@@ -143,6 +144,7 @@ class AddAssigneeThread(Thread):
         self.host = request.get_host()
         self.protocol = "https" if request.is_secure() else "http"
 
+    @reuse_smtp_connections()
     def run(self) -> None:
         super().run()
 
@@ -202,6 +204,7 @@ class RemoveAssigneeThread(Thread):
         self.host = request.get_host()
         self.protocol = "https" if request.is_secure() else "http"
 
+    @reuse_smtp_connections()
     def run(self) -> None:
         super().run()
 
@@ -258,3 +258,6 @@ EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
 EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=True)
 EMAIL_USE_SSL = env.bool("EMAIL_USE_SSL", default=False)
 EMAIL_TIMEOUT = env.int("EMAIL_TIMEOUT", default=10)
+# Write EmailLog rows after the response is sent instead of inside send_messages.
+# Sends outside a request (management commands, threads) are always logged immediately.
+HORILLA_EMAIL_LOG_ASYNC = env.bool("HORILLA_EMAIL_LOG_ASYNC", default=True)
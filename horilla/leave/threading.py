@@ -7,7 +7,7 @@ from django.db.models import Q
 from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 
-from base.backends import ConfiguredEmailBackend
+from base.backends import ConfiguredEmailBackend, reuse_smtp_connections
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +60,7 @@ class LeaveMailSendThread(Thread):
                         self.request, f"Mail not sent to {recipient.get_full_name()}"
                     )
 
+    @reuse_smtp_connections()
     def run(self) -> None:
         super().run()
         if self.type == "request":
@@ -10,7 +10,7 @@ from threading import Thread
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 
-from base.backends import ConfiguredEmailBackend
+from base.backends import ConfiguredEmailBackend, reuse_smtp_connections
 from employee.models import EmployeeWorkInformation
 from payroll.models.models import Payslip
 from payroll.views.views import payslip_pdf
@@ -31,6 +31,7 @@ class MailSendThread(Thread):
         self.host = request.get_host()
         self.protocol = "https" if request.is_secure() else "http"
 
+    @reuse_smtp_connections()
     def run(self) -> None:
         super().run()
         for record in list(self.result_dict.values()):
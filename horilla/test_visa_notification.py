@@ -5,6 +5,7 @@ Run this from Django shell: python manage.py shell < test_visa_notification.py
 
 from datetime import date, timedelta
 from django.contrib.auth.models import User
+from django.db import transaction
 from employee.models import Employee
 
 print("=" * 70)
@@ -72,29 +73,39 @@ test_cases = [
 
 print(f"\nCreating {len(test_cases)} test employees:\n")
 
-for i, test_case in enumerate(test_cases, 1):
-    visa_date = date.today() + timedelta(days=test_case['days'])
-    
-    try:
-        employee = Employee.objects.create(
-            employee_first_name=f"Test{i}",
-            employee_last_name=f"Visa{test_case['days']}Days",
-            email=test_case['email'],
-            phone=f"+123456789{i}",
-            visa_expire_date=visa_date,
-            is_active=True
-        )
-        
+# Create everything in one transaction: the visa signal queues notifications and
+# sends them all on commit over a single SMTP connection.
+# Employee.objects.create (not bulk_create) keeps Employee.save() side effects,
+# such as creating the login user.
+report = []
+with transaction.atomic():
+    for i, test_case in enumerate(test_cases, 1):
+        visa_date = date.today() + timedelta(days=test_case['days'])
+
+        try:
+            with transaction.atomic():
+                employee = Employee.objects.create(
+                    employee_first_name=f"Test{i}",
+                    employee_last_name=f"Visa{test_case['days']}Days",
+                    email=test_case['email'],
+                    phone=f"+123456789{i}",
+                    visa_expire_date=visa_date,
+                    is_active=True
+                )
+        except Exception as e:
+            report.append(f"❌ Error creating employee: {e}\n")
+            continue
+
         status = "✅ Should send" if test_case['should_send'] else "❌ Should NOT send"
-        print(f"{i}. {test_case['name']}")
-        print(f"   Employee: {employee.get_full_name()}")
-        print(f"   Email: {employee.email}")
-        print(f"   Visa Date: {visa_date.strftime('%d %b %Y')}")
-        print(f"   Email Status: {status}")
-        print()
-        
-    except Exception as e:
-        print(f"❌ Error creating employee: {e}\n")
+        report.append(
+            f"{i}. {test_case['name']}\n"
+            f"   Employee: {employee.get_full_name()}\n"
+            f"   Email: {employee.email}\n"
+            f"   Visa Date: {visa_date.strftime('%d %b %Y')}\n"
+            f"   Email Status: {status}\n"
+        )
+
+print("\n".join(report))
 
 # Step 4: Summary
 print("=" * 70)